@@ -14,4 +14,5 @@ setuptools.setup(
     url="https://gitlab.corp.zulily.com/datascience/dskit",
     packages=setuptools.find_packages(),
     python_requires='>=3.9',
+    extras_require={'lxml': ['lxml']},
 )
\ No newline at end of file
@@ -27,13 +27,94 @@ source.team_heatmap(team='home', hm_type='attack')
 source.player_possession_heatmap(player='12345', possession='in')
 """  
 
-from typing import Tuple, Union
-from xml.etree.ElementTree import Element, ElementTree
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Iterable, List, Tuple, Union
+from xml.etree.ElementTree import ElementTree
+
+# lxml is optional: it parses large TF05 files much faster than the stdlib parser,
+# and its elements support the same find()/get() API used throughout this module.
+try:
+    from lxml import etree as _etree
+    from lxml.etree import _Element as Element
+except ImportError:
+    import xml.etree.ElementTree as _etree
+    from xml.etree.ElementTree import Element
 
-import matplotlib.pyplot as plt
-import mplsoccer as mpl
 import numpy as np
 
+# matplotlib and mplsoccer are slow to import, and are only needed for plotting:
+# they are imported by the plotting methods themselves.
+if TYPE_CHECKING: # for the annotations only
+    import matplotlib.colorbar
+    import matplotlib.text
+    import mplsoccer
+
+
+# Lookup table from ASCII code to heatmap digit; anything that is not a digit maps to 0
+_HM_LUT = np.zeros(256, dtype=np.uint8)
+_HM_LUT[ord('0'):ord('9') + 1] = np.arange(10, dtype=np.uint8)
+
+# Stands in for keyword arguments that were not provided, without allocating a new dict each time
+_EMPTY = MappingProxyType({})
+
+
+@lru_cache(maxsize=512)
+def _parse_hm(hm_string: str, shape: Tuple[int, int]) -> np.array:
+    """Converts a heatmap string into an array of the given (width, length) shape; cached across instances."""
+
+    # Each character is one digit: translate the ASCII codes to digits with a single table lookup
+    buf = np.frombuffer(hm_string.encode('ascii'), dtype=np.uint8)
+    if buf.size != shape[0] * shape[1]:
+        raise ValueError("Invalid heatmap: expected {} values, but found {}".format(shape[0] * shape[1], buf.size))
+    hm_array = _HM_LUT[buf].reshape(shape)
+    hm_array.flags.writeable = False # shared by every caller of the cache
+    return hm_array
+
+
+@lru_cache(maxsize=16)
+def _bin_edges(left: float, right: float, top: float, bottom: float, nx: int, ny: int) -> dict:
+    """Returns the bucket coordinates of an nx-by-ny heatmap, as produced by mplsoccer's bin_statistic().
+    
+    The buckets span the pitch from left to right and, as in bin_statistic(), the first row of the
+    heatmap is at the top of the pitch. The result is cached, so its arrays are read-only.
+    """
+
+    x_edge = np.linspace(left, right, nx + 1)
+    y_edge = np.linspace(top, bottom, ny + 1)
+    x_grid, y_grid = np.meshgrid(x_edge, y_edge)
+    cx, cy = np.meshgrid((x_edge[:-1] + x_edge[1:]) / 2, (y_edge[:-1] + y_edge[1:]) / 2)
+    bin_edges = {'x_grid': x_grid, 'y_grid': y_grid, 'cx': cx, 'cy': cy}
+    for edges in bin_edges.values():
+        edges.flags.writeable = False
+    return bin_edges
+
+
+# The document parsed by each worker process of save_player_possession_heatmaps()
+_worker_source = None
+
+
+def _init_heatmap_worker(cls: type, tf05_fname: str, pitch_length: float, pitch_width: float, pitch_type: str,
+                         fast_render: bool) -> None:
+    """Parses the document once per worker process, and selects a non-interactive backend for plotting."""
+
+    global _worker_source
+    import matplotlib
+    matplotlib.use('Agg')
+    _worker_source = cls(tf05_fname, pitch_length, pitch_width, pitch_type, fast_render)
+    _worker_source.parse()
+
+
+def _save_player_possession_heatmap(player: str, fname: str, plot_kwargs: dict) -> str:
+    """Plots a player possession heatmap in a worker process and saves it to a file."""
+
+    hm_params = _worker_source.player_possession_heatmap(player, close_on_return=True, **plot_kwargs)
+    hm_params['fig'].savefig(fname)
+    return fname
+
 
 class TracabTf05Xml(ElementTree):
     """Tracab TF05 XML file parser and plotter.
@@ -43,11 +124,16 @@ class TracabTf05Xml(ElementTree):
     for plotting corresponding team-level and player-level heatmaps.
 
     Relies on (but does not inherit from) mplsoccer.Pitch(), pandas, and matplotlib. 
+    Uses lxml to parse the document if it is installed, and falls back to the
+    standard library parser otherwise.
     
     Attributes:
         pitch_length: the length of the soccer pitch to use as input to Pitch() (default is 105)
         pitch_width: the width of the soccer pitch to use as input to Pitch() (deafult is 68)
         pitch_type: the type of soccer pitch to use as input to Pitch() (default is 'skillcorner')
+        fast_render: if True, draw heatmaps as a single image with imshow(); if False, draw them 
+          cell by cell with pitch.heatmap(), which accepts pcolormesh() keyword arguments like
+          edgecolors (default is True)
     
     Attributes:
         f05_fname:
@@ -68,13 +154,49 @@ class TracabTf05Xml(ElementTree):
         sport_name:    
     """
     
-    def __init__ (self, tf05_fname: str, pitch_length: float = 105, pitch_width: float = 68, pitch_type: str = 'skillcorner') -> None:
+    # Heatmap dimensions according to Tracab format
+    __HM_WIDTH = 14 #y axis
+    __HM_LENGTH = 20 #x axis
+    __HM_SHAPE = (__HM_WIDTH, __HM_LENGTH)
+    
+    # Translators English <-> XML element tag. These, and the plotting defaults below, 
+    # are constants shared by all instances: read-only views guard them against modification.
+    __TEAM_HEATMAP_DICT = MappingProxyType({'overall': 'sHeatmap',
+                                            'defence': 'sDefenceHeatmap',
+                                            'midfield': 'sMidfieldHeatmap',
+                                            'attack': 'sAttackHeatmap'})
+    __POSSESSION_HEATMAP_DICT = MappingProxyType({'overall': 'sHeatmap',
+                                                  'first-half': 'sFirstHalfHeatmap',
+                                                  'second-half': 'sSecondHalfHeatmap'})
+    __TEAM_DICT = MappingProxyType({'home': 'HomeTeam', 'away': 'AwayTeam'})
+    # Possession type -> (XML element tag, English description for the plot titles)
+    __POSSESSION_DICT = MappingProxyType({'in': ('OwnTeamPossession', 'in possession'),
+                                          'out': ('OpponentPossession', 'out of possession')})
+    # The valid heatmap types, as listed in error messages
+    __VALID_TEAM_HEATMAPS = ", ".join(__TEAM_HEATMAP_DICT)
+    __VALID_POSSESSION_HEATMAPS = ", ".join(__POSSESSION_HEATMAP_DICT)
+    
+    # Defaults for plotting the pitch and the heatmap
+    __DEFAULT_PITCH_KWARGS = MappingProxyType({'line_zorder': 2, 'pitch_color': '#22312b', 'line_color': 'black'})
+    __DEFAULT_HEATMAP_KWARGS = MappingProxyType({'cmap': 'Blues'})
+    # These come straight from a pitch.grid() example on mplsoccer
+    __DEFAULT_GRID_KWARGS = MappingProxyType({'endnote_height': 0.03, 'endnote_space': 0,
+        'grid_width': 0.88, 'left': 0.025, 'title_height': 0.06, 'title_space': 0,
+        'axis': False, 'grid_height': 0.86, 'figheight': 6.5})
+    # Styles of the texts around the heatmap. White is given as RGBA, so matplotlib does not need to parse a color name
+    __TITLE_TEXT_KWARGS = MappingProxyType({'color': (1, 1, 1, 1), 'va': 'center', 'ha': 'center', 'fontsize': 30})
+    __SUBTITLE_TEXT_KWARGS = MappingProxyType({**__TITLE_TEXT_KWARGS, 'fontsize': 15})
+    __ENDNOTE_TEXT_KWARGS = MappingProxyType({'color': (1, 1, 1, 1), 'va': 'center', 'ha': 'right', 'fontsize': 15})
+    
+    def __init__ (self, tf05_fname: str, pitch_length: float = 105, pitch_width: float = 68, pitch_type: str = 'skillcorner',
+                  fast_render: bool = True) -> None:
         """Initializer for TracabTf05Xml class."""
 
         # These are the only public attibutes
         self.pitch_length = pitch_length
         self.pitch_width = pitch_width
         self.pitch_type = pitch_type
+        self.fast_render = fast_render
         
         # The source file is set once and for all (final static)
         self.__tf05_fname = tf05_fname
@@ -95,28 +217,19 @@ class TracabTf05Xml(ElementTree):
         self.__season_id = None
         self.__sport_id = None
         self.__sport_name = None
+        self.__teams = None # 'home'/'away' -> team node
+        self.__team_sides = None # 'home'/'away'/team name -> 'home'/'away'
+        self.__team_names = None # 'home'/'away' -> team name
+        self.__players_by_id = None # player id -> player entry, see parse()
+        self.__players_by_name = None # player name -> player entry, see parse()
+        self.__players_by_team = None # 'home'/'away' -> {'id': [...], 'jersey': [...], 'name': [...]}
+        self.__endnote_text = None # match info printed at the bottom of every plot
 
-        # Heatmap dimensions according to Tracab format
-        self.__HM_WIDTH = 14 #y axis
-        self.__HM_LENGTH = 20 #x axis
-        
-        # Translators English <-> XML element tag
-        self.__team_heatmap_dict = {'overall': 'sHeatmap',
-                                  'defence': 'sDefenceHeatmap',
-                                  'midfield': 'sMidfieldHeatmap',
-                                  'attack': 'sAttackHeatmap'}
-        self.__possession_heatmap_dict = {'overall': 'sHeatmap',
-                                          'first-half': 'sFirstHalfHeatmap',
-                                          'second-half': 'sSecondHalfHeatmap'}
-        self.__team_dict = {'home': 'HomeTeam', 'away': 'AwayTeam'}
-        
-        # Defaults for plotting the pitch and the heatmap
-        self.__default_pitch_kwargs = {'line_zorder': 2, 'pitch_color': '#22312b', 'line_color': 'black'}
-        self.__default_heatmap_kwargs = {'cmap': 'Blues'}
-        # These come straight from a pitch.grid() example on mplsoccer
-        self.__default_grid_kwargs = {'endnote_height': 0.03, 'endnote_space': 0,
-            'grid_width': 0.88, 'left': 0.025, 'title_height': 0.06, 'title_space': 0,
-            'axis': False, 'grid_height': 0.86, 'figheight': 6.5}
+        # Pitch objects only hold configuration, so they are built once per set of keyword arguments
+        self.__pitches = {}
+        
+        # The last player possession heatmap plotted, which can be updated in place: see player_possession_heatmap()
+        self.__last_possession_plot = None
         
         ElementTree.__init__(self)
         
@@ -141,7 +254,7 @@ class TracabTf05Xml(ElementTree):
     def away_team_id(self) -> str: 
         return self.__away_team_id
     @property
-    def match_duration(self) -> str:    
+    def match_duration(self) -> float:    
         return self.__match_duration
     @property
     def arena_name(self) -> str:  
@@ -181,16 +294,17 @@ class TracabTf05Xml(ElementTree):
 
         Returns:
             A dictionary with these keys:
-              'heatmap_kwargs': the dictionary of default keyword arguments to the pitch.heatmap()
-                method from the mplsoccer package, which is called by the plotting methods.
+              'heatmap_kwargs': the dictionary of default keyword arguments to matplotlib's imshow(), or to the
+                pitch.heatmap() method from the mplsoccer package if fast_render is False, which is called by the
+                plotting methods.
               'pitch_kwargs': the dictionary of default keyword arguments to the Pitch() constructor
                 from the mplsoccer package, which is called by the plotting methods.
               'grid_kwargs': the dictionary of default keyword arguments to the pitch.grid() method
                 from the mplsoccer package, which is called by the plotting methods.    
         """
-        return {'heatmap_kwargs': self.__default_heatmap_kwargs,
-                'pitch_kwargs': self.__default_pitch_kwargs,
-                'grid_kwargs': self.__default_grid_kwargs}
+        return {'heatmap_kwargs': self.__DEFAULT_HEATMAP_KWARGS,
+                'pitch_kwargs': self.__DEFAULT_PITCH_KWARGS,
+                'grid_kwargs': self.__DEFAULT_GRID_KWARGS}
 
     def parse(self) -> None:
         """Parses the XML document.
@@ -202,15 +316,15 @@ class TracabTf05Xml(ElementTree):
             None 
         """
 
-        ElementTree.parse(self, self.__tf05_fname)
+        self._setroot(_etree.parse(self.__tf05_fname).getroot())
         
-        match_info = self.find('TracabDocument')
+        match_info = self.find('TracabDocument').attrib
         self.__match_id = match_info.get('iMatchId')
         self.__home_team_name = match_info.get('sHomeTeamName')
         self.__home_team_id = match_info.get('iHomeTeamId')
         self.__away_team_name = match_info.get('sAwayTeamName')
         self.__away_team_id = match_info.get('iAwayTeamId')
-        self.__match_duration = float(match_info.get('iTotalGameTime'))/60000 #duration in minutes
+        self.__match_duration = float(match_info['iTotalGameTime'])/60000.0 #duration in minutes
         self.__arena_name = match_info.get('sArenaName')
         self.__arena_id = match_info.get('iArenaId')
         self.__competion_name = match_info.get('sCompetitionName')
@@ -220,7 +334,33 @@ class TracabTf05Xml(ElementTree):
         self.__season_id = match_info.get('iSeasonId')
         self.__sport_id = match_info.get('iSportId')
         self.__sport_name = match_info.get('sSportName')
-
+        self.__endnote_text = '{} v. {}, {}'.format(self.__home_team_name, self.__away_team_name, self.__match_date)
+
+        # Index teams and players once, so that lookups never walk the tree again
+        self.__teams = {side: self.find(tag) for side, tag in self.__TEAM_DICT.items()}
+        self.__team_sides = {self.__home_team_name: 'home', self.__away_team_name: 'away',
+                             'home': 'home', 'away': 'away'}
+        self.__team_names = {'home': self.__home_team_name, 'away': self.__away_team_name}
+        self.__players_by_id = {}
+        self.__players_by_name = {}
+        self.__players_by_team = {}
+        for side, team_node in self.__teams.items():
+            team_name = team_node.get('sTeamName')
+            team_players = self.__players_by_team[side] = {'id': [], 'jersey': [], 'name': []}
+            for p in team_node.findall('Player'):
+                player_id = p.get('iPlayerId')
+                player_name = p.get('sPlayerName')
+                player_jersey = p.get('iJersey')
+                # Keep direct references to the possession nodes that the heatmaps are read from
+                entry = {'elem': p, 'id': player_id, 'team': team_name, 'name': player_name, 'jersey': player_jersey,
+                         'title_prefix': f'{player_name} - {team_name} #{player_jersey}',
+                         'possession': {possession: p.find('PossessionData/' + tag)
+                                        for possession, (tag, _) in self.__POSSESSION_DICT.items()}}
+                self.__players_by_id.setdefault(player_id, entry)
+                self.__players_by_name.setdefault(player_name, entry)
+                team_players['id'].append(player_id)
+                team_players['jersey'].append(player_jersey)
+                team_players['name'].append(player_name)
 
     def summary(self) -> None:
         """Prints a match summary.
@@ -240,65 +380,180 @@ class TracabTf05Xml(ElementTree):
         print(f"Match duration: {self.match_duration} minutes")
         
     
+    def heatmap_sum(self, hm_strings: Iterable[str]) -> np.array:
+        """Sums several heatmaps into one.
+        
+        Useful for synthesizing the heatmap of a subset of players, for example the attackers of a team:
+        hm_strings = [source.get_player(p)[0].get('sHeatmap') for p in ['Lionel MESSI', 'Angel DI MARIA']]
+        source.heatmap_sum(hm_strings)
+
+        Args:
+            hm_strings: the heatmap strings to sum, as they appear in the document.
+
+        Returns:
+            A numpy array of dtype uint16 with the cell-by-cell sum of the heatmaps.
+
+        Raises:
+            A ValueError if any of the heatmap strings is invalid.
+        """
+        
+        total = np.zeros(self.__HM_SHAPE, dtype=np.uint16)
+        for hm_string in hm_strings:
+            total += _parse_hm(hm_string, self.__HM_SHAPE)
+        return total
+    
     def __make_heatmap_array(self, hm_string: str) -> np.array:
         """Constructs a numpy array from the document's string heatmap."""
 
-        hm_array = (np.array([int(c) for c in hm_string])).reshape(self.__HM_WIDTH,self.__HM_LENGTH)
+        # The same heatmaps are plotted over and over: parse each string only once
+        hm_array = _parse_hm(hm_string, self.__HM_SHAPE).copy()
         return hm_array
                               
-    def __plot_core_heatmap(self, hm_array: np.array, pitch_kwargs: dict, hm_kwargs: dict, grid_kwargs: dict) -> dict:
+    def __get_pitch(self, pitch_kwargs: dict) -> 'mplsoccer.Pitch':
+        """Returns the Pitch for the given keyword arguments, reusing one built previously if possible."""
+        
+        import mplsoccer as mpl
+        
+        try:
+            key = frozenset(pitch_kwargs.items())
+        except TypeError: # unhashable argument values: nothing to key the cache on
+            return mpl.Pitch(**pitch_kwargs)
+        pitch = self.__pitches.get(key)
+        if pitch is None:
+            pitch = self.__pitches[key] = mpl.Pitch(**pitch_kwargs)
+        return pitch
+    
+    def __plot_core_heatmap(self, hm_array: np.array, pitch_kwargs: dict, hm_kwargs: dict, grid_kwargs: dict,
+                            axs: dict = None) -> dict:
         """Plot the core heatmap."""
         
-        if pitch_kwargs is None:
-            pitch_kwargs = self.__default_pitch_kwargs
-        if hm_kwargs is None:
-            hm_kwargs = self.__default_heatmap_kwargs
-        if grid_kwargs is None:
-            grid_kwargs = self.__default_grid_kwargs
-        
-        if 'pitch_type' not in pitch_kwargs:
-            pitch_kwargs['pitch_type'] = self.pitch_type
-        if 'pitch_width' not in pitch_kwargs:
-            pitch_kwargs['pitch_width'] = self.pitch_width
-        if 'pitch_length' not in pitch_kwargs:
-            pitch_kwargs['pitch_length'] = self.pitch_length    
+        # Merge the caller's arguments over the defaults, without modifying either
+        pitch_kwargs = {'pitch_type': self.pitch_type, 'pitch_width': self.pitch_width, 'pitch_length': self.pitch_length,
+                        **self.__DEFAULT_PITCH_KWARGS, **(pitch_kwargs if pitch_kwargs is not None else _EMPTY)}
+        hm_kwargs = {**self.__DEFAULT_HEATMAP_KWARGS, **(hm_kwargs if hm_kwargs is not None else _EMPTY)}
+        grid_kwargs = {**self.__DEFAULT_GRID_KWARGS, **(grid_kwargs if grid_kwargs is not None else _EMPTY)}
         
         #This comes from an example in the mplsoccer online documentation
-        pitch = mpl.Pitch(**pitch_kwargs)
-        fig, axs = pitch.grid(**grid_kwargs)
+        pitch = self.__get_pitch(pitch_kwargs)
+        if axs is None:
+            fig, axs = pitch.grid(**grid_kwargs)
+        else:
+            # Re-use the caller's figure: wipe the previous plot, but keep the layout of the axes
+            fig = axs['pitch'].figure
+            for ax in fig.axes:
+                if ax not in axs.values(): # e.g. a previous colorbar
+                    ax.remove()
+            for name, ax in axs.items():
+                for text in list(ax.texts):
+                    if name == 'title':
+                        # Hide the titles: __set_text() re-uses them for the titles of the new plot
+                        text.set_visible(False)
+                    # The endnote only depends on the match: keep it if it is already this match's
+                    elif name != 'endnote' or text.get_text() != self.__endnote_text:
+                        text.remove()
+            axs['pitch'].clear()
+            pitch.draw(ax=axs['pitch'])
         if 'pitch_color' in pitch_kwargs:
             fig.set_facecolor(pitch_kwargs['pitch_color']) 
-
-        # pitch.heatmap() expects as argument the output produced by pitch.bin_statistic(),
-        # however we already have the 'statistic', which is the heatmap array read in from the XML file.
-        # All we need from bin_statistic() are the heatmap bucket coordinates. So we use random 
-        # data just to produce the bucket edges, but over-write the 'statistic' output with our own data.
-        x = np.random.rand(100,) * pitch_kwargs['pitch_length']
-        y = np.random.rand(100,) * pitch_kwargs['pitch_width']
-        bin_stats = pitch.bin_statistic(x,y, statistic='count', bins=(self.__HM_LENGTH,self.__HM_WIDTH))
-        bin_stats['statistic'] = hm_array #forcefully replacing the counts with given heatmap        
-        phm = pitch.heatmap(bin_stats, ax = axs['pitch'], **hm_kwargs)
+        if not (pitch_kwargs.get('axis') or pitch_kwargs.get('label') or pitch_kwargs.get('tick')):
+            # The pitch axes show no ticks: skip locating and formatting them at every draw.
+            # (The title and endnote axes are switched off altogether by pitch.grid().)
+            from matplotlib.ticker import NullLocator
+            for axis in (axs['pitch'].xaxis, axs['pitch'].yaxis):
+                axis.set_major_locator(NullLocator())
+                axis.set_minor_locator(NullLocator())
+
+        dim = pitch.dim
+        if not hm_array.any():
+            # Nothing to show (e.g. a player with no possession data): skip the heatmap and say so
+            phm = None
+            axs['pitch'].text((dim.left + dim.right) / 2, (dim.top + dim.bottom) / 2, 'No data',
+                              **self.__TITLE_TEXT_KWARGS)
+        elif self.fast_render:
+            # The heatmap is already binned: draw it as one image spanning the pitch, rather than as
+            # a mesh of cells. The first row of the heatmap is at the top of the pitch. Each cell is
+            # a flat block of color, so no resampling filter is needed.
+            ax = axs['pitch']
+            phm = ax.imshow(hm_array, extent=(dim.left, dim.right, dim.bottom, dim.top), origin='upper',
+                            aspect=ax.get_aspect(), **{'zorder': 1, 'interpolation': 'nearest', **hm_kwargs})
+        else:
+            # pitch.heatmap() expects as argument the output produced by pitch.bin_statistic(),
+            # however we already have the 'statistic', which is the heatmap array read in from the XML file.
+            # All we need from bin_statistic() are the heatmap bucket coordinates, which only depend on the pitch.
+            bin_stats = dict(_bin_edges(dim.left, dim.right, dim.top, dim.bottom, self.__HM_LENGTH, self.__HM_WIDTH))
+            bin_stats['statistic'] = hm_array
+            phm = pitch.heatmap(bin_stats, ax = axs['pitch'], **hm_kwargs)
         
         return {'fig': fig, 'axs': axs, 'phm': phm, 'pitch': pitch} #documented in the calling function
     
 
-    def __add_colorbar(self, fig, phm):
+    def __add_colorbar(self, fig, phm) -> 'matplotlib.colorbar.Colorbar':
         """Adds a colorbar to an existing heatmap."""
 
+        import matplotlib.pyplot as plt
+        
+        if phm is None: # empty heatmap, nothing to map colors for
+            return None
+        
         # These work well with defaults; no guarantees for other choices
         ax_cbar = fig.add_axes((0.915, 0.093, 0.03, 0.786))
         cbar = plt.colorbar(phm, cax=ax_cbar)
+        cbar.minorticks_off() # never needed, even if enabled in rcParams: avoids creating unused ticks
         cbar.outline.set_edgecolor('#efefef')
         cbar.ax.yaxis.set_tick_params(color='#efefef')
         plt.setp(plt.getp(cbar.ax.axes, 'yticklabels'), color='#efefef')
+        return cbar
+        
+
+    def __is_figure_open(self, fig) -> bool:
+        """Tells whether pyplot still manages a figure, i.e. it has not been closed."""
+        
+        import matplotlib.pyplot as plt
+        
+        return plt.fignum_exists(fig.number)
+        
+
+    def __close_figure(self, fig) -> None:
+        """Closes a figure, releasing it from pyplot."""
+        
+        import matplotlib.pyplot as plt
+        
+        plt.close(fig)
+        
+
+    def __set_text(self, ax, x: float, y: float, s: str, **text_kwargs) -> 'matplotlib.text.Text':
+        """Writes text at a position of the axes, re-using the Text left there by a previous plot, if any."""
+        
+        for text in ax.texts:
+            if text.get_position() == (x, y):
+                text.set_text(s)
+                text.update(text_kwargs)
+                text.set_visible(True)
+                return text
+        return ax.text(x, y, s, **text_kwargs)
         
 
     def __add_endnote(self, ax) -> None:
         """Add the match info as an endonte to the plots."""
         
-        endnote_text = '{} v. {}, {}'.format(self.__home_team_name, self.__away_team_name, self.__match_date)
-        ax.text(1, 0.5, endnote_text, va='center', ha='right', fontsize=15, color='white')
+        # A re-used figure may already show it
+        if any(text.get_text() == self.__endnote_text for text in ax.texts):
+            return
+        ax.text(1, 0.5, self.__endnote_text, **self.__ENDNOTE_TEXT_KWARGS)
+        
         
+    def __resolve_team_side(self, team: str) -> str:
+        """Returns 'home' or 'away' for a team given as 'home', 'away', or the team name."""
+        
+        side = self.__team_sides.get(team)
+        if side is None:
+            raise ValueError("Invalid team argument: must be 'home', 'away', or the exact team name. Check your spelling")
+        return side
+        
+    def __resolve_team_name(self, team: str) -> str:
+        """Returns the name of a team given as 'home', 'away', or the team name."""
+        
+        return self.__team_names[self.__resolve_team_side(team)]
         
     def get_team(self, team: str) -> Element:
         """Returns the team node.
@@ -315,15 +570,7 @@ class TracabTf05Xml(ElementTree):
             A ValueError if the team argument is invalid. 
         """
         
-        if team in ['home', 'away']:
-            this_team = self.find(self.__team_dict[team])
-        elif team == self.__home_team_name:
-            this_team = self.find(self.__team_dict['home'])
-        elif  team == self.__away_team_name:
-            this_team = self.find(self.__team_dict['away'])
-        else:
-            raise ValueError("Invalid team argument: must be 'home', 'away', or the exact team name. Check your spelling")
-        return this_team
+        return self.__teams[self.__resolve_team_side(team)]
     
     def get_team_players(self, team: str) -> dict:
         """Returns all of a team's players.
@@ -338,24 +585,18 @@ class TracabTf05Xml(ElementTree):
               'name': the name of the player
         """
         
-        this_team = self.get_team(team)
-        players = this_team.findall('Player')
-        player_id = []
-        player_name = []
-        player_jersey = []
-        for p in players:
-            player_id.append(p.get('iPlayerId'))
-            player_name.append(p.get('sPlayerName'))
-            player_jersey.append(p.get('iJersey'))
-        
-        return {'id': player_id, 'jersey': player_jersey, 'name': player_name}
+        # Hand out copies, so that callers cannot modify the index built by parse()
+        team_players = self.__players_by_team[self.__resolve_team_side(team)]
+        return {key: list(values) for key, values in team_players.items()}
 
 
-    def get_team_possession(self, team: str) -> dict:
+    def get_team_possession(self, team: str = None, possession_stats: Element = None) -> dict:
         """Returns a team's possession statistics.
         
          Args:
             team: either 'home' or 'away' or the name of the team (exact spelling).
+            possession_stats: the team's PossessionData node, if already at hand. 
+              When provided, the team argument is ignored (default is None).
 
         Returns:
             A dictionary with keys:
@@ -363,14 +604,16 @@ class TracabTf05Xml(ElementTree):
               'pct_possession': the overall percentage of possession.    
         """
 
-        possession_stats = (self.get_team(team)).find('PossessionData')
+        if possession_stats is None:
+            possession_stats = (self.get_team(team)).find('PossessionData')
         avg_possession_time = float(possession_stats.get('iAvgTimePerPossession'))/1000 #ms -> sec
         pct_possession = float(possession_stats.get('fPossessionPercentage'))
         return {'avg_possession_time': avg_possession_time, 'pct_possession': pct_possession}
 
     
     def team_heatmap(self, team: str, hm_type: str = 'overall', add_cbar: bool = False, pitch_kwargs: dict = None,
-                     hm_kwargs: dict = None, grid_kwargs: dict = None) -> dict:
+                     hm_kwargs: dict = None, grid_kwargs: dict = None,
+                     axs: dict = None, close_on_return: bool = False) -> dict:
         """Plots a heatmap for a team.
         
         Plots a heatmap for the given team, cumulative over the entire duration of the match.
@@ -385,17 +628,21 @@ class TracabTf05Xml(ElementTree):
               'attack': the heatmap generated by the attackers 
             add_cbar: if True, add a default colorbar to the hetamap (default is False)
             pitch_kwargs: any keyword arguments that can be provided to mplsoccer.Pitch().
-              If None, uses the default arguments (default is None).
-            hm_kwargs: any keyword arguments that can be provided to pitch.heatmap().
-              If None, uses the default arguments (default is None).
+              Any argument not provided takes its default value (default is None).
+            hm_kwargs: any keyword arguments that can be provided to imshow(), or to pitch.heatmap() if fast_render is False.
+              Any argument not provided takes its default value (default is None).
             grid_kwargs: any keyword arguments that can be provided to pitch.grid().
-              If None, uses the default arguments (default is None).  
+              Any argument not provided takes its default value (default is None).  
+            axs: the axes of a previous plot, as returned in hm_params['axs']. If provided, the heatmap
+              is drawn into them, replacing the previous plot, instead of creating a new figure (default is None).
+            close_on_return: if True, close the figure before returning, so that pyplot does not keep it open,
+              for example when saving many plots in a loop (default is False).
 
         Returns:
             A dictionary of handles to graphics objects for optional further manipulation, with keys:
             'fig': the handle to the figure, as returned by pitch.grid().
             'axs': the set of axes as returned by pitch.grid().
-            'phm': the handle to the heatmap, as returned by pitch.heatmap().
+            'phm': the handle to the heatmap, as returned by imshow() or pitch.heatmap(), or None if the heatmap is empty.
             'pitch': the pitch object created by mplsoccer.Pitch().
 
         Raises:
@@ -404,26 +651,20 @@ class TracabTf05Xml(ElementTree):
         
         this_team = self.get_team(team)
         
-        if hm_type not in self.__team_heatmap_dict.keys():
-            valid_heatmaps = ", ".join([h for h in self.__team_heatmap_dict.keys()])
-            raise ValueError("Invalid heatmap type: must be one of ({}), but provided {}".format(valid_heatmaps, hm_type))
+        hm_attr = self.__TEAM_HEATMAP_DICT.get(hm_type)
+        if hm_attr is None:
+            raise ValueError("Invalid heatmap type: must be one of ({}), but provided {}".format(self.__VALID_TEAM_HEATMAPS, hm_type))
             
-        hm_string = this_team.get(self.__team_heatmap_dict[hm_type])
+        hm_string = this_team.get(hm_attr)
         hm_array = self.__make_heatmap_array(hm_string)      
-        hm_params = self.__plot_core_heatmap(hm_array, pitch_kwargs, hm_kwargs, grid_kwargs)
+        hm_params = self.__plot_core_heatmap(hm_array, pitch_kwargs, hm_kwargs, grid_kwargs, axs)
         
         # Add title
-        if team == 'home':
-            this_team_name = self.__home_team_name
-        elif team == 'away':
-            this_team_name = self.__away_team_name
-        else:
-            this_team_name = team
+        this_team_name = self.__resolve_team_name(team)
         title_text ='{} - {}'.format(this_team_name, hm_type)
         axs = hm_params['axs']
-        _ = axs['title'].text(0.5, 0.45, title_text, color='white',
-                             va='center', ha='center', fontsize=30) #path_effects=path_eff,
-                             #fontproperties=robotto_regular.prop, fontsize=30)
+        _ = self.__set_text(axs['title'], 0.5, 0.45, title_text, **self.__TITLE_TEXT_KWARGS) #path_effects=path_eff,
+                            #fontproperties=robotto_regular.prop, fontsize=30)
         
         # Put the match info in the end note
         self.__add_endnote(axs['endnote'])
@@ -432,11 +673,15 @@ class TracabTf05Xml(ElementTree):
         if add_cbar:
             self.__add_colorbar(hm_params['fig'], hm_params['phm'])
             
+        if close_on_return:
+            self.__close_figure(hm_params['fig'])
+
         return hm_params
 
 
     def team_possession_heatmap(self, team: str, possession: str = 'in', hm_type: str = 'overall', add_cbar: bool = False,
-                                pitch_kwargs: dict = None, hm_kwargs: dict = None, grid_kwargs: dict = None) -> dict:
+                                pitch_kwargs: dict = None, hm_kwargs: dict = None, grid_kwargs: dict = None,
+                                axs: dict = None, close_on_return: bool = False) -> dict:
         """Plots a possession heatmap for a team.
         
         Plots a possession heatmap for the given team: can be in-possession or out-of-possession,
@@ -453,17 +698,21 @@ class TracabTf05Xml(ElementTree):
               'second-half': only the second half. 
             add_cbar: if True, add a default colorbar to the hetamap (default is False)
             pitch_kwargs: any keyword arguments that can be provided to mplsoccer.Pitch().
-              If None, uses the default arguments (default is None).
-            hm_kwargs: any keyword arguments that can be provided to pitch.heatmap().
-              If None, uses the default arguments (default is None).
+              Any argument not provided takes its default value (default is None).
+            hm_kwargs: any keyword arguments that can be provided to imshow(), or to pitch.heatmap() if fast_render is False.
+              Any argument not provided takes its default value (default is None).
             grid_kwargs: any keyword arguments that can be provided to pitch.grid().
-              If None, uses the default arguments (default is None).
+              Any argument not provided takes its default value (default is None).
+            axs: the axes of a previous plot, as returned in hm_params['axs']. If provided, the heatmap
+              is drawn into them, replacing the previous plot, instead of creating a new figure (default is None).
+            close_on_return: if True, close the figure before returning, so that pyplot does not keep it open,
+              for example when saving many plots in a loop (default is False).
 
         Returns:
             A dictionary of handles to graphics objects for optional further manipulation, with keys:
             'fig': the handle to the figure, as returned by pitch.grid().
             'axs': the set of axes as returned by pitch.grid().
-            'phm': the handle to the heatmap, as returned by pitch.heatmap().
+            'phm': the handle to the heatmap, as returned by imshow() or pitch.heatmap(), or None if the heatmap is empty.
             'pitch': the pitch object created by mplsoccer.Pitch().
 
         Raises:
@@ -473,47 +722,32 @@ class TracabTf05Xml(ElementTree):
         # Get the team - also checks valid team string
         this_team = self.get_team(team)
         
+        if possession not in self.__POSSESSION_DICT:
+            raise ValueError("Invalid possession type: must be one of ('in', 'out'), but provided {}".format(possession))
+        (possession_tag, possession_string) = self.__POSSESSION_DICT[possession]
         summary_possession_stats = this_team.find('PossessionData')
-        if possession == 'in':
-            possession_data = summary_possession_stats.find('OwnTeamPossession')
-        elif possession == 'out':
-            possession_data = summary_possession_stats.find('OpponentPossession')
-        else:
-            raise ValueError("Inavlid possession type: must be one of ('in', 'out'), but provided {}".format(possession))
+        possession_data = summary_possession_stats.find(possession_tag)
         
-        if hm_type not in self.__possession_heatmap_dict.keys():
-            valid_heatmaps = ", ".join([h for h in self.__possession_heatmap_dict.keys()])
-            raise ValueError("Invalid heatmap type: must be one of ({}), but provided {}".format(valid_heatmaps, hm_type)) 
-        hm_string = possession_data.get(self.__possession_heatmap_dict[hm_type])
+        hm_attr = self.__POSSESSION_HEATMAP_DICT.get(hm_type)
+        if hm_attr is None:
+            raise ValueError("Invalid heatmap type: must be one of ({}), but provided {}".format(self.__VALID_POSSESSION_HEATMAPS, hm_type))
+        hm_string = possession_data.get(hm_attr)
         hm_array = self.__make_heatmap_array(hm_string)
-        hm_params = self.__plot_core_heatmap(hm_array, pitch_kwargs, hm_kwargs, grid_kwargs)
+        hm_params = self.__plot_core_heatmap(hm_array, pitch_kwargs, hm_kwargs, grid_kwargs, axs)
             
          # BEGIN Add title
-        if team == 'home':
-            this_team_name = self.__home_team_name
-        elif team == 'away':
-            this_team_name = self.__away_team_name
-        else:
-            this_team_name = team
-        if possession == 'in':
-            possession_string = 'in possession'
-        elif possession == 'out':
-            possession_string = 'out of possession'
-        else: # this should never happen because we checked up above - keeping it in case code changes
-            raise ValueError("Inavlid possession type: must be one of ('in', 'out'), but provided {}".format(possession))
-                
+        this_team_name = self.__resolve_team_name(team)
         title_text = f'{this_team_name} - {possession_string} - {hm_type}'
         axs = hm_params['axs']
-        _ = axs['title'].text(0.5, 0.75, title_text, color='white',
-                             va='center', ha='center', fontsize=30)
+        _ = self.__set_text(axs['title'], 0.5, 0.75, title_text, **self.__TITLE_TEXT_KWARGS)
         # Add possession time and percentage only to the overall heatmap because the data only provide overall numbers.
         # It would be confusing to add them to first-half and second-half heatmaps
         if hm_type == 'overall': 
-            possession_stats = self.get_team_possession(team)
+            possession_stats = self.get_team_possession(possession_stats=summary_possession_stats)
             # Note y coordinate: placement is below the previous title, and the font is smaller so this results in a sub-title
-            _ = axs['title'].text(0.5, 0.05, 
-                                  f"Possession: {possession_stats['pct_possession']:.0f}% Avg. time/possession:{possession_stats['avg_possession_time']: 1.1f}s",
-                                  color='white', va='center', ha='center', fontsize=15)
+            _ = self.__set_text(axs['title'], 0.5, 0.05, 
+                                f"Possession: {possession_stats['pct_possession']:.0f}% Avg. time/possession:{possession_stats['avg_possession_time']: 1.1f}s",
+                                **self.__SUBTITLE_TEXT_KWARGS)
         # END Add title
         
         # Put the match info in the endnote
@@ -522,97 +756,102 @@ class TracabTf05Xml(ElementTree):
         if add_cbar:
             self.__add_colorbar(hm_params['fig'], hm_params['phm'])
             
+        if close_on_return:
+            self.__close_figure(hm_params['fig'])
+
         return hm_params
     
     
-    def get_player(self, player: Union[str, int]) -> Tuple[Element, str]:
-        """Finds a player."""
+    def __find_player_entry(self, player: Union[str, int]) -> dict:
+        """Returns the index entry of a player given by id or by name."""
         
-        #Find the player
+        # Search by player id first, then by name
         player = str(player)
-        home_team = self.find('HomeTeam')
-        away_team = self.find('AwayTeam') 
-        
-        # Try searching by player id first
-        query_by_id = "Player/[@iPlayerId='{}']".format(player)
-        player_node = home_team.find(query_by_id)
-        player_team = home_team.get('sTeamName')
-
-        if player_node is None: # we did not find the player within the home team
-            player_node = away_team.find(query_by_id)
-            player_team = away_team.get('sTeamName')
-                
-        # If still no result, try searching by name
-        if player_node is None:
-            query_by_name = "Player/[@sPlayerName='{}']".format(player)         
-            player_node = home_team.find(query_by_name)
-            player_team = home_team.get('sTeamName')
-            if player_node is None:
-                player_node = away_team.find(query_by_name)
-                player_team = away_team.get('sTamName')
-            
-        # If still not found, something's wrong
-        if player_node is None:
-            player_team = None
+        entry = self.__players_by_id.get(player) or self.__players_by_name.get(player)
+        if entry is None:
             raise ValueError("Player node not found. Check the player ID or player name you provided. Player names must be spelled exactly as they are in the document.")
+        return entry
+    
+    def get_player(self, player: Union[str, int]) -> Tuple[Element, str]:
+        """Finds a player.
         
-        return (player_node, player_team)
+        Looks up the player in the index built by parse(): first by player id, then by name.
+
+        Args:
+            player: the player ID or the player name (exact spelling).
+
+        Returns:
+            A tuple with the player's ElementTree.Element node and the name of the player's team.
+
+        Raises:
+            A ValueError if the player is not found.
+        """
+        
+        entry = self.__find_player_entry(player)
+        return (entry['elem'], entry['team'])
     
     
     def player_heatmap(self, player: Union[str,int], add_cbar: bool = False, pitch_kwargs: dict = None, 
-                       hm_kwargs: dict = None, grid_kwargs: dict = None) -> dict:
+                       hm_kwargs: dict = None, grid_kwargs: dict = None,
+                       axs: dict = None, close_on_return: bool = False) -> dict:
         """Plots the overall, whole-game heatmap and average location of a player. 
         
         Args:
           player: the player ID or the player name (exact match).
           add_cbar: if True, add a default colorbar to the hetamap (default is False)
           pitch_kwargs: any keyword arguments that can be provided to mplsoccer.Pitch().
-              If None, uses the default arguments (default is None).
-          hm_kwargs: any keyword arguments that can be provided to pitch.heatmap().
-              If None, uses the default arguments (default is None).
+              Any argument not provided takes its default value (default is None).
+          hm_kwargs: any keyword arguments that can be provided to imshow(), or to pitch.heatmap() if fast_render is False.
+              Any argument not provided takes its default value (default is None).
           grid_kwargs: any keyword arguments that can be provided to pitch.grid().
-              If None, uses the default arguments (default is None).
+              Any argument not provided takes its default value (default is None).
+          axs: the axes of a previous plot, as returned in hm_params['axs']. If provided, the heatmap
+            is drawn into them, replacing the previous plot, instead of creating a new figure (default is None).
+          close_on_return: if True, close the figure before returning, so that pyplot does not keep it open,
+            for example when saving many plots in a loop (default is False).
 
         Returns:
             A dictionary of handles to graphics objects for optional further manipulation, with keys:
             'fig': the handle to the figure, as returned by pitch.grid().
             'axs': the set of axes as returned by pitch.grid().
-            'phm': the handle to the heatmap, as returned by pitch.heatmap().
+            'phm': the handle to the heatmap, as returned by imshow() or pitch.heatmap(), or None if the heatmap is empty.
             'pitch': the pitch object created by mplsoccer.Pitch().
 
         Raises:
             A ValueError if the player is not found.
         """
         
-        (this_player, player_team) = self.get_player(player)
+        player_entry = self.__find_player_entry(player)
+        this_player = player_entry['elem']
         # Frustrating: coordinates are always in some other frame of reference!
         # Found out by trial and error that we must flip these
         avg_x = -1.0 * float(this_player.get('fAvgPosX'))
         avg_y = -1.0 * float(this_player.get('fAvgPosY'))
         hm_string = this_player.get('sHeatmap')
         hm_array = self.__make_heatmap_array(hm_string)
-        hm_params = self.__plot_core_heatmap(hm_array, pitch_kwargs, hm_kwargs, grid_kwargs)
+        hm_params = self.__plot_core_heatmap(hm_array, pitch_kwargs, hm_kwargs, grid_kwargs, axs)
         axs = hm_params['axs']
         pitch = hm_params['pitch']
         pitch.scatter(avg_x, avg_y, s=100, c='red', marker='o', ax=axs['pitch'])
         
         # Add title
-        player_name = this_player.get('sPlayerName')
-        player_jersey = this_player.get('iJersey')
-        title_text = f'{player_name} - {player_team} #{player_jersey} - overall'
-        _ = axs['title'].text(0.5, 0.75, title_text, color='white',
-                             va='center', ha='center', fontsize=30)
+        title_text = f"{player_entry['title_prefix']} - overall"
+        _ = self.__set_text(axs['title'], 0.5, 0.75, title_text, **self.__TITLE_TEXT_KWARGS)
         # Add endnote
         self.__add_endnote(axs['endnote'])
         
         if add_cbar:
             self.__add_colorbar(hm_params['fig'], hm_params['phm'])
 
+        if close_on_return:
+            self.__close_figure(hm_params['fig'])
+
         return hm_params
 
     def player_possession_heatmap(self, player: Union[str,int], possession: str = 'in', hm_type: str = 'overall',
                                   add_cbar: bool = False, pitch_kwargs: dict = None, hm_kwargs: dict = None,
-                                  grid_kwargs: dict = None) -> dict:
+                                  grid_kwargs: dict = None, axs: dict = None, close_on_return: bool = False,
+                                  reuse: bool = False) -> dict:
         """Plots a possession heatmap for a player.
         
         Plots a possession heatmap for a player: can be in-possession or out-of-possession,
@@ -639,17 +878,25 @@ class TracabTf05Xml(ElementTree):
               'second-half': only the second half. 
             add_cbar: if True, add a default colorbar to the hetamap (default is False)
             pitch_kwargs: any keyword arguments that can be provided to mplsoccer.Pitch().
-              If None, uses the default arguments (default is None).
-            hm_kwargs: any keyword arguments that can be provided to pitch.heatmap().
-              If None, uses the default arguments (default is None).
+              Any argument not provided takes its default value (default is None).
+            hm_kwargs: any keyword arguments that can be provided to imshow(), or to pitch.heatmap() if fast_render is False.
+              Any argument not provided takes its default value (default is None).
             grid_kwargs: any keyword arguments that can be provided to pitch.grid().
-              If None, uses the default arguments (default is None).  
+              Any argument not provided takes its default value (default is None).  
+            axs: the axes of a previous plot, as returned in hm_params['axs']. If provided, the heatmap
+              is drawn into them, replacing the previous plot, instead of creating a new figure (default is None).
+            close_on_return: if True, close the figure before returning, so that pyplot does not keep it open,
+              for example when saving many plots in a loop (default is False).
+            reuse: if True, and the figure of the previous call is still open and showing that plot, update its
+              heatmap, color limits (unless fixed by vmin, vmax or norm in hm_kwargs), and title in place
+              instead of drawing a new figure, which is much faster when cycling through players interactively.
+              The styling arguments and axs are then ignored (default is False).
 
         Returns:
             A dictionary of handles to graphics objects for optional further manipulation, with keys:
             'fig': the handle to the figure, as returned by pitch.grid().
             'axs': the set of axes as returned by pitch.grid().
-            'phm': the handle to the heatmap, as returned by pitch.heatmap().
+            'phm': the handle to the heatmap, as returned by imshow() or pitch.heatmap(), or None if the heatmap is empty.
             'pitch': the pitch object created by mplsoccer.Pitch().
 
         Raises:
@@ -657,45 +904,115 @@ class TracabTf05Xml(ElementTree):
         """
         
 
-         # Get the player - also checks valid team string
-        (this_player, player_team) = self.get_player(player)
-        
-        summary_possession_stats = this_player.find('PossessionData')
-        if possession == 'in':
-            possession_data = summary_possession_stats.find('OwnTeamPossession')
-        elif possession == 'out':
-            possession_data = summary_possession_stats.find('OpponentPossession')
+         # Get the player - also checks valid player string
+        this_player = self.__find_player_entry(player)
+        
+        if possession not in self.__POSSESSION_DICT:
+            raise ValueError("Invalid possession type: must be one of ('in', 'out'), but provided {}".format(possession))
+        possession_string = self.__POSSESSION_DICT[possession][1]
+        possession_data = this_player['possession'][possession]
+        
+        hm_attr = self.__POSSESSION_HEATMAP_DICT.get(hm_type)
+        if hm_attr is None:
+            raise ValueError("Invalid heatmap type: must be one of ({}), but provided {}".format(self.__VALID_POSSESSION_HEATMAPS, hm_type))
+        # Repeated plots of the same heatmap share the cached, read-only array: no copy needed
+        hm_array = _parse_hm(possession_data.get(hm_attr), self.__HM_SHAPE)
+        title_text = f"{this_player['title_prefix']} - {possession_string} - {hm_type}"
+        
+        last_plot = self.__last_possession_plot
+        if (reuse and last_plot is not None and last_plot['hm_params']['phm'] is not None and hm_array.any()
+                and last_plot['hm_params']['phm'].axes is not None # not cleared by another plot
+                and self.__is_figure_open(last_plot['hm_params']['fig'])):
+            # Update the previous plot in place: only the heatmap data and the title change
+            hm_params = last_plot['hm_params']
+            phm = hm_params['phm']
+            phm.set_array(hm_array)
+            if last_plot['autoscale']:
+                phm.autoscale()
+            last_plot['title'].set_text(title_text)
+            # Share the existing colorbar, if any, rather than building a new one
+            if last_plot['cbar'] is not None:
+                last_plot['cbar'].update_normal(phm)
+            elif add_cbar:
+                last_plot['cbar'] = self.__add_colorbar(hm_params['fig'], phm)
+            hm_params['fig'].canvas.draw_idle()
         else:
-            raise ValueError("Inavlid possession type: must be one of ('in', 'out'), but provided {}".format(possession))
-        
-        if hm_type not in self.__possession_heatmap_dict.keys():
-            valid_heatmaps = ", ".join([h for h in self.__possession_heatmap_dict.keys()])
-            raise ValueError("Invalid heatmap type: must be one of ({}), but provided {}".format(valid_heatmaps, hm_type)) 
-        hm_string = possession_data.get(self.__possession_heatmap_dict[hm_type])
-        hm_array = self.__make_heatmap_array(hm_string)
-        hm_params = self.__plot_core_heatmap(hm_array, pitch_kwargs, hm_kwargs, grid_kwargs) 
-        
-        # BEGIN Add title
-        if possession == 'in':
-            possession_string = 'in possession'
-        elif possession == 'out':
-            possession_string = 'out of possession'
-        else: # this "else" branch should never happen because we checked up above - keeping it in case code changes
-            raise ValueError("Inavlid possession type: must be one of ('in', 'out'), but provided {}".format(possession))
+            hm_params = self.__plot_core_heatmap(hm_array, pitch_kwargs, hm_kwargs, grid_kwargs, axs)
             
-        player_name = this_player.get('sPlayerName')
-        player_jersey = this_player.get('iJersey')
-        title_text = f'{player_name} - {player_team} #{player_jersey} - {possession_string} - {hm_type}'
-        axs = hm_params['axs']
-        _ = axs['title'].text(0.5, 0.75, title_text, color='white',
-                             va='center', ha='center', fontsize=30)
-        # END Add title
+            # BEGIN Add title
+            axs = hm_params['axs']
+            title_artist = self.__set_text(axs['title'], 0.5, 0.75, title_text, **self.__TITLE_TEXT_KWARGS)
+            # END Add title
+            
+            # Add match info at the bottom
+            self.__add_endnote(axs['endnote'])
+            
+            # Add colorbar?
+            cbar = None
+            if add_cbar:
+                cbar = self.__add_colorbar(hm_params['fig'], hm_params['phm'])
+            
+            # Color limits fixed by the caller are kept by later updates, e.g. to compare players
+            hm_kwargs = hm_kwargs if hm_kwargs is not None else _EMPTY
+            autoscale = not any(key in hm_kwargs for key in ('vmin', 'vmax', 'norm'))
+            self.__last_possession_plot = {'hm_params': hm_params, 'title': title_artist, 'cbar': cbar,
+                                           'autoscale': autoscale}
+
+        if close_on_return:
+            self.__close_figure(hm_params['fig'])
+
+        return hm_params
+    
+
+    def save_player_possession_heatmaps(self, players: Iterable[Union[str,int]], savedir: str, possession: str = 'in',
+                                        hm_type: str = 'overall', add_cbar: bool = False, pitch_kwargs: dict = None,
+                                        hm_kwargs: dict = None, grid_kwargs: dict = None, max_workers: int = None) -> List[str]:
+        """Plots possession heatmaps for many players in parallel, and saves them to PNG files.
         
-        # Add match info at the bottom
-        self.__add_endnote(axs['endnote'])
+        Each heatmap is plotted as by player_possession_heatmap() and saved to a file named 
+        <player id>_<possession>_<hm_type>.png in the given directory. The plots are spread over
+        a pool of worker processes: each one parses the document once, and plots with the
+        non-interactive Agg backend. 
+
+        Example:
+          # In-possession heatmaps for the whole away team
+          source.save_player_possession_heatmaps(source.get_team_players('away')['id'], './heatmaps')
         
-        # Add colorbar?
-        if add_cbar:
-            self.__add_colorbar(hm_params['fig'], hm_params['phm'])
+        Args:
+            players: the player IDs or the player names (exact spelling).
+            savedir: the directory to save the files to. It is created if it does not exist.
+            possession: either 'in' or 'out' for in-possession and out-of-possession. (default is 'in')
+            hm_type: the type of heatmap to plot, as in player_possession_heatmap() (default is 'overall').
+            add_cbar: if True, add a default colorbar to the hetamaps (default is False)
+            pitch_kwargs: any keyword arguments that can be provided to mplsoccer.Pitch().
+              Any argument not provided takes its default value (default is None).
+            hm_kwargs: any keyword arguments that can be provided to imshow(), or to pitch.heatmap() if fast_render is False.
+              Any argument not provided takes its default value (default is None).
+            grid_kwargs: any keyword arguments that can be provided to pitch.grid().
+              Any argument not provided takes its default value (default is None).
+            max_workers: the number of worker processes. If None, uses as many as there are CPUs (default is None).
+
+        Returns:
+            The list of the saved files, in the same order as the players.
 
-        return hm_params
\ No newline at end of file
+        Raises:
+            A ValueError if a player is not found or the possession type or heatmap type is invalid.
+        """
+        
+        # Check all the arguments here, rather than failing in the worker processes
+        if possession not in self.__POSSESSION_DICT:
+            raise ValueError("Invalid possession type: must be one of ('in', 'out'), but provided {}".format(possession))
+        if hm_type not in self.__POSSESSION_HEATMAP_DICT:
+            raise ValueError("Invalid heatmap type: must be one of ({}), but provided {}".format(self.__VALID_POSSESSION_HEATMAPS, hm_type))
+        player_ids = [self.__find_player_entry(player)['id'] for player in players]
+        
+        os.makedirs(savedir, exist_ok=True)
+        fnames = [os.path.join(savedir, f'{player_id}_{possession}_{hm_type}.png') for player_id in player_ids]
+        plot_kwargs = {'possession': possession, 'hm_type': hm_type, 'add_cbar': add_cbar,
+                       'pitch_kwargs': pitch_kwargs, 'hm_kwargs': hm_kwargs, 'grid_kwargs': grid_kwargs}
+        
+        # Workers only receive the player ids and plotting arguments, never the parsed document
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_heatmap_worker,
+                                 initargs=(type(self), self.__tf05_fname, self.pitch_length, self.pitch_width,
+                                           self.pitch_type, self.fast_render)) as executor:
+            return list(executor.map(_save_player_possession_heatmap, player_ids, fnames, repeat(plot_kwargs)))